@@ -3,16 +3,19 @@ Simple demonstration of the Text Summarization Tool
 Shows clear before/after examples with all methods
 """
 
+import sys
+
 from text_summarizer import TextSummarizer
 
 
-def demo():
-    """Run a simple, clear demonstration."""
-    
-    summarizer = TextSummarizer()
-    
-    # Sample article about technology
-    article = """
+# Module-level so repeated demo() calls reuse one summarizer and its caches
+_SUMMARIZER = TextSummarizer()
+
+SEP100 = "=" * 100
+DASH100 = "-" * 100
+
+# Sample article about technology
+_AI_ARTICLE = """
     Artificial intelligence has revolutionized the way we interact with technology in the modern world. 
     Machine learning algorithms have become increasingly sophisticated, enabling computers to learn from 
     data and make predictions without being explicitly programmed. Deep learning, a subset of machine 
@@ -27,26 +30,17 @@ def demo():
     challenges including bias in training data, lack of transparency in decision-making processes, and 
     concerns about privacy and security. Researchers are working on developing more ethical and 
     explainable AI systems that can be trusted in critical applications.
-    """
-    
-    print("\n" + "="*100)
-    print(" "*35 + "TEXT SUMMARIZATION TOOL")
-    print(" "*25 + "Natural Language Processing Demonstration")
-    print("="*100)
-    
-    print("\n📄 ORIGINAL ARTICLE:")
-    print("-"*100)
-    print(article.strip())
-    print("-"*100)
+"""
+
+
+def demo():
+    """Run a simple, clear demonstration."""
     
-    # Get original stats
-    sentences = summarizer.tokenize_sentences(article)
-    words = article.split()
-    print(f"\n📊 Original Length: {len(words)} words, {len(sentences)} sentences")
+    summarizer = _SUMMARIZER
+    article = _AI_ARTICLE
     
-    print("\n" + "="*100)
-    print(" "*30 + "SUMMARIZATION RESULTS (3 sentences)")
-    print("="*100)
+    # Get original stats once; each summary below only adds its own counts
+    original_stats = summarizer.compute_original_stats(article)
     
     methods = [
         ('frequency', 'Frequency-Based Analysis'),
@@ -55,40 +49,67 @@ def demo():
         ('hybrid', 'Hybrid Approach (Recommended)')
     ]
     
+    # Tokenize and score the article once for every method and length below
+    prepared = summarizer.prepare(article)
+    
+    results = summarizer.summarize_multi(prepared, 3, [method_key for method_key, _ in methods])
+    
+    # Each section is collected into one list and written in a single call
+    out = [
+        "\n" + SEP100,
+        " "*35 + "TEXT SUMMARIZATION TOOL",
+        " "*25 + "Natural Language Processing Demonstration",
+        SEP100,
+        "\n📄 ORIGINAL ARTICLE:",
+        DASH100,
+        article.strip(),
+        DASH100,
+        f"\n📊 Original Length: {original_stats['original_words']} words, {original_stats['original_sentences']} sentences",
+        "\n" + SEP100,
+        " "*30 + "SUMMARIZATION RESULTS (3 sentences)",
+        SEP100,
+    ]
+    
     for method_key, method_name in methods:
-        print(f"\n\n🔍 METHOD: {method_name}")
-        print("-"*100)
-        
-        summary = summarizer.summarize(article, num_sentences=3, method=method_key)
-        stats = summarizer.get_summary_stats(article, summary)
-        
-        print(f"\n✨ SUMMARY:")
-        print(summary)
+        summary = results[method_key]
+        stats = summarizer.compute_delta_stats(original_stats, summary)
         
-        print(f"\n📊 STATISTICS:")
-        print(f"   • Summary Length: {stats['summary_words']} words, {stats['summary_sentences']} sentences")
-        print(f"   • Compression Ratio: {stats['compression_ratio']}")
-        print(f"   • Words Saved: {stats['original_words'] - stats['summary_words']} words")
+        out.append(f"\n\n🔍 METHOD: {method_name}")
+        out.append(DASH100)
+        out.append(f"\n✨ SUMMARY:")
+        out.append(summary)
+        summary_words = stats['summary_words']
+        out.append(
+            f"\n📊 STATISTICS:\n"
+            f"   • Summary Length: {summary_words} words, {stats['summary_sentences']} sentences\n"
+            f"   • Compression Ratio: {stats['compression_ratio']}\n"
+            f"   • Words Saved: {original_stats['original_words'] - summary_words} words"
+        )
     
-    print("\n\n" + "="*100)
-    print(" "*40 + "COMPARISON EXAMPLE")
-    print("="*100)
+    sys.stdout.write("\n".join(out) + "\n")
     
-    # Show different summary lengths
-    print("\n📝 Same article with different summary lengths (using HYBRID method):\n")
+    out = [
+        "\n\n" + SEP100,
+        " "*40 + "COMPARISON EXAMPLE",
+        SEP100,
+        # Show different summary lengths
+        "\n📝 Same article with different summary lengths (using HYBRID method):\n",
+    ]
     
     for num_sent in [2, 3, 5]:
-        summary = summarizer.summarize(article, num_sentences=num_sent, method='hybrid')
-        stats = summarizer.get_summary_stats(article, summary)
+        summary = summarizer.summarize(prepared, num_sentences=num_sent, method='hybrid')
+        stats = summarizer.compute_delta_stats(original_stats, summary)
         
-        print(f"\n{num_sent}-Sentence Summary ({stats['compression_ratio']} compression):")
-        print("-"*100)
-        print(summary)
+        out.append(f"\n{num_sent}-Sentence Summary ({stats['compression_ratio']} compression):")
+        out.append(DASH100)
+        out.append(summary)
+    
+    out.append("\n\n" + SEP100)
+    out.append(" "*42 + "✅ DEMO COMPLETE")
+    out.append(SEP100)
+    out.append("\n💡 TIP: Run 'python interactive_summarizer.py' to try with your own text!\n")
     
-    print("\n\n" + "="*100)
-    print(" "*42 + "✅ DEMO COMPLETE")
-    print("="*100)
-    print("\n💡 TIP: Run 'python interactive_summarizer.py' to try with your own text!\n")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
@@ -3,26 +3,183 @@ Interactive Text Summarization Tool
 Allows users to input their own text and get summaries with different methods.
 """
 
-from text_summarizer import TextSummarizer, print_separator, print_section_header
+import functools
+import os
+import sys
+
+from text_summarizer import PreparedDoc, TextSummarizer, print_separator, print_section_header
+
+
+# One summarizer for the whole session, so prepared texts carry over between menu choices
+_SUMMARIZER = TextSummarizer()
+
+SEP80 = "=" * 80
+DASH80 = "-" * 80
+
+# Sample articles offered in the menu
+_AI_ARTICLE = """
+    Artificial intelligence has revolutionized the way we interact with technology in the modern world. 
+    Machine learning algorithms have become increasingly sophisticated, enabling computers to learn from 
+    data and make predictions without being explicitly programmed. Deep learning, a subset of machine 
+    learning, uses neural networks with multiple layers to process complex patterns in large datasets. 
+    These technologies have found applications in various fields including healthcare, finance, 
+    transportation, and entertainment. In healthcare, AI systems can analyze medical images to detect 
+    diseases with remarkable accuracy, sometimes surpassing human experts. Financial institutions use 
+    machine learning algorithms to detect fraudulent transactions and assess credit risk. Self-driving 
+    cars rely on deep learning models to interpret sensor data and navigate safely through traffic. 
+    Natural language processing, another branch of AI, has enabled virtual assistants like Siri and 
+    Alexa to understand and respond to human speech. Despite these advances, AI still faces significant 
+    challenges including bias in training data, lack of transparency in decision-making processes, and 
+    concerns about privacy and security. Researchers are working on developing more ethical and 
+    explainable AI systems that can be trusted in critical applications.
+"""
+
+_CLIMATE_ARTICLE = """
+    Climate change represents one of the most pressing challenges facing humanity in the 21st century.
+    The Earth's average temperature has risen by approximately 1.1 degrees Celsius since the pre-industrial
+    era, primarily due to human activities that release greenhouse gases into the atmosphere. Carbon dioxide
+    emissions from burning fossil fuels for energy, transportation, and industrial processes are the main
+    contributors to global warming. Deforestation further exacerbates the problem by reducing the planet's
+    capacity to absorb carbon dioxide. The consequences of climate change are already visible around the world.
+    Extreme weather events such as hurricanes, droughts, and heatwaves have become more frequent and intense.
+    Rising sea levels threaten coastal communities and small island nations. Arctic ice is melting at an
+    alarming rate, endangering polar ecosystems and contributing to further warming. Changes in precipitation
+    patterns affect agriculture and water resources, potentially leading to food insecurity in vulnerable
+    regions. Transitioning to renewable energy sources such as solar, wind, and hydroelectric power is 
+    essential for reducing carbon emissions. International cooperation through agreements like the Paris 
+    Climate Accord is necessary to coordinate global efforts.
+"""
+
+# Prepared sample articles, filled in the first time each one is selected
+_SAMPLE_CACHE = {}
+
+# Prepared documents are pickled here so later sessions can skip tokenization.
+# Entries are keyed on the summarizer source and stop words as well as the text,
+# so editing either makes older entries unreachable. Only the most recently used are kept.
+_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.ts_tool_cache')
+_CACHE_MAX_ENTRIES = 32
+
+
+@functools.lru_cache(maxsize=None)
+def _source_fingerprint():
+    """Digest of the summarizer module source, which defines preprocessing and tokenization."""
+    import hashlib
+    
+    try:
+        with open(sys.modules[TextSummarizer.__module__].__file__, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except (AttributeError, OSError, TypeError):
+        return ''  # Source unavailable; load_prepared still checks each entry's text
+
+
+def _cache_path(summarizer, text):
+    """Disk cache file for text prepared by this summarizer's code and stop words."""
+    import hashlib
+    
+    key = hashlib.sha1()
+    key.update(_source_fingerprint().encode('ascii'))
+    key.update(b'\0')
+    # surrogatepass: stdin decodes undecodable bytes to lone surrogates, which plain UTF-8 rejects
+    key.update(' '.join(sorted(summarizer.stop_words)).encode('utf-8', 'surrogatepass'))
+    key.update(b'\0')
+    key.update(text.encode('utf-8', 'surrogatepass'))
+    return os.path.join(_CACHE_DIR, f"{key.hexdigest()}.pkl")
+
+
+def _prune_cache():
+    """Delete the least recently used cache entries beyond _CACHE_MAX_ENTRIES."""
+    paths = [os.path.join(_CACHE_DIR, name) for name in os.listdir(_CACHE_DIR) if name.endswith('.pkl')]
+    if len(paths) > _CACHE_MAX_ENTRIES:
+        paths.sort(key=os.path.getmtime, reverse=True)
+        for path in paths[_CACHE_MAX_ENTRIES:]:
+            os.remove(path)
+
+
+def load_prepared(summarizer, text):
+    """Prepare text, reusing the copy saved on disk by an earlier session if there is one."""
+    # Imported here so the menu does not wait on modules only the disk cache needs
+    import pickle
+    
+    path = _cache_path(summarizer, text)
+    
+    try:
+        with open(path, 'rb') as f:
+            prepared = pickle.load(f)
+    except Exception:
+        prepared = None  # Missing or unreadable cache entry; rebuilt below
+    
+    # Only trust an entry that really is a prepared copy of this text
+    if isinstance(prepared, PreparedDoc) and prepared.text == summarizer.preprocess_text(text):
+        try:
+            os.utime(path)  # Mark as recently used for _prune_cache
+        except OSError:
+            pass
+        return prepared
+    
+    prepared = summarizer.prepare(text)
+    
+    try:
+        # Entries hold the full pasted text, so keep them readable by the owner only.
+        # chmod also tightens a directory created by an earlier version.
+        os.makedirs(_CACHE_DIR, mode=0o700, exist_ok=True)
+        os.chmod(_CACHE_DIR, 0o700)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(prepared, f)
+        _prune_cache()
+    except OSError:
+        pass  # The disk cache is optional, e.g. when the home directory is read-only
+    
+    return prepared
+
+
+def prepare_sample(summarizer, name, text):
+    """Prepare a sample article once and reuse it whenever it is selected again."""
+    if name not in _SAMPLE_CACHE:
+        _SAMPLE_CACHE[name] = load_prepared(summarizer, text)
+    return _SAMPLE_CACHE[name]
 
 
 def get_multiline_input():
     """Get multiline text input from user."""
     print("\n📝 Enter or paste your text (press Ctrl+Z then Enter on Windows, or Ctrl+D on Unix when done):")
-    print("-" * 80)
-    lines = []
-    try:
-        while True:
-            line = input()
-            lines.append(line)
-    except EOFError:
-        pass
-    return '\n'.join(lines)
+    print(DASH80)
+    # Read everything up to EOF in one call rather than line by line
+    return sys.stdin.read()
+
+
+def read_user_text(summarizer):
+    """Text source for menu option 1; returns None when no text was entered."""
+    text = get_multiline_input()
+    if not text.strip():
+        print("\n❌ No text entered. Please try again.")
+        return None
+    return text, load_prepared(summarizer, text)
+
+
+def use_ai_sample(summarizer):
+    """Text source for menu option 2."""
+    print("\n📄 Using sample AI article...")
+    return _AI_ARTICLE, prepare_sample(summarizer, 'ai', _AI_ARTICLE)
+
+
+def use_climate_sample(summarizer):
+    """Text source for menu option 3."""
+    print("\n📄 Using sample Climate Change article...")
+    return _CLIMATE_ARTICLE, prepare_sample(summarizer, 'climate', _CLIMATE_ARTICLE)
+
+
+# Menu choice -> function returning (text, prepared document)
+TEXT_SOURCES = {
+    '1': read_user_text,
+    '2': use_ai_sample,
+    '3': use_climate_sample
+}
 
 
 def interactive_mode():
     """Run the summarizer in interactive mode."""
-    summarizer = TextSummarizer()
+    summarizer = _SUMMARIZER
     
     print("\n")
     print_separator('=', 80)
@@ -31,13 +188,13 @@ def interactive_mode():
     print("\n")
     
     while True:
-        print("\n" + "="*80)
+        print("\n" + SEP80)
         print("OPTIONS:")
         print("  1. Summarize your own text")
         print("  2. Use sample article (AI)")
         print("  3. Use sample article (Climate Change)")
         print("  4. Exit")
-        print("="*80)
+        print(SEP80)
         
         choice = input("\nEnter your choice (1-4): ").strip()
         
@@ -45,55 +202,27 @@ def interactive_mode():
             print("\n👋 Thank you for using the Text Summarization Tool!\n")
             break
         
-        if choice == '1':
-            text = get_multiline_input()
-            if not text.strip():
-                print("\n❌ No text entered. Please try again.")
-                continue
-        
-        elif choice == '2':
-            text = """
-            Artificial intelligence has revolutionized the way we interact with technology in the modern world. 
-            Machine learning algorithms have become increasingly sophisticated, enabling computers to learn from 
-            data and make predictions without being explicitly programmed. Deep learning, a subset of machine 
-            learning, uses neural networks with multiple layers to process complex patterns in large datasets. 
-            These technologies have found applications in various fields including healthcare, finance, 
-            transportation, and entertainment. In healthcare, AI systems can analyze medical images to detect 
-            diseases with remarkable accuracy, sometimes surpassing human experts. Financial institutions use 
-            machine learning algorithms to detect fraudulent transactions and assess credit risk. Self-driving 
-            cars rely on deep learning models to interpret sensor data and navigate safely through traffic. 
-            Natural language processing, another branch of AI, has enabled virtual assistants like Siri and 
-            Alexa to understand and respond to human speech. Despite these advances, AI still faces significant 
-            challenges including bias in training data, lack of transparency in decision-making processes, and 
-            concerns about privacy and security. Researchers are working on developing more ethical and 
-            explainable AI systems that can be trusted in critical applications.
-            """
-            print("\n📄 Using sample AI article...")
-        
-        elif choice == '3':
-            text = """
-            Climate change represents one of the most pressing challenges facing humanity in the 21st century.
-            The Earth's average temperature has risen by approximately 1.1 degrees Celsius since the pre-industrial
-            era, primarily due to human activities that release greenhouse gases into the atmosphere. Carbon dioxide
-            emissions from burning fossil fuels for energy, transportation, and industrial processes are the main
-            contributors to global warming. Deforestation further exacerbates the problem by reducing the planet's
-            capacity to absorb carbon dioxide. The consequences of climate change are already visible around the world.
-            Extreme weather events such as hurricanes, droughts, and heatwaves have become more frequent and intense.
-            Rising sea levels threaten coastal communities and small island nations. Arctic ice is melting at an
-            alarming rate, endangering polar ecosystems and contributing to further warming. Changes in precipitation
-            patterns affect agriculture and water resources, potentially leading to food insecurity in vulnerable
-            regions. Transitioning to renewable energy sources such as solar, wind, and hydroelectric power is 
-            essential for reducing carbon emissions. International cooperation through agreements like the Paris 
-            Climate Accord is necessary to coordinate global efforts.
-            """
-            print("\n📄 Using sample Climate Change article...")
-        
-        else:
+        source = TEXT_SOURCES.get(choice)
+        if source is None:
             print("\n❌ Invalid choice. Please try again.")
             continue
         
+        selected = source(summarizer)
+        if selected is None:
+            continue
+        text, prepared = selected
+        # Summaries of this text by method; the length is fixed until another text is chosen
+        summaries = {}
+        
+        # Original-text statistics are shared by every summary of this text
+        original_stats = summarizer.compute_original_stats(text)
+        original_line = (
+            f"   • Original: {original_stats['original_words']} words, "
+            f"{original_stats['original_sentences']} sentences"
+        )
+        
         # Get summarization parameters
-        print("\n" + "-"*80)
+        print("\n" + DASH80)
         try:
             num_sentences = int(input("Enter number of sentences for summary (default 3): ").strip() or "3")
         except ValueError:
@@ -118,23 +247,26 @@ def interactive_mode():
         method = method_map.get(method_choice, 'hybrid')
         
         # Generate summary
-        print("\n" + "="*80)
+        print("\n" + SEP80)
         print("🔄 Processing...")
-        print("="*80)
+        print(SEP80)
         
         try:
-            summary = summarizer.summarize(text, num_sentences=num_sentences, method=method)
-            stats = summarizer.get_summary_stats(text, summary)
+            if method not in summaries:
+                summaries[method] = summarizer.summarize(prepared, num_sentences=num_sentences, method=method)
+            summary = summaries[method]
+            stats = summarizer.compute_delta_stats(original_stats, summary)
             
             print(f"\n✨ SUMMARY ({method.upper()} method):")
-            print("-"*80)
+            print(DASH80)
             print(summary)
-            print("-"*80)
+            print(DASH80)
             
-            print(f"\n📊 STATISTICS:")
-            print(f"   • Original: {stats['original_words']} words, {stats['original_sentences']} sentences")
-            print(f"   • Summary: {stats['summary_words']} words, {stats['summary_sentences']} sentences")
-            print(f"   • Compression Ratio: {stats['compression_ratio']}")
+            print(
+                f"\n📊 STATISTICS:\n{original_line}\n"
+                f"   • Summary: {stats['summary_words']} words, {stats['summary_sentences']} sentences\n"
+                f"   • Compression Ratio: {stats['compression_ratio']}"
+            )
             
         except Exception as e:
             print(f"\n❌ Error: {e}")
@@ -154,18 +286,21 @@ def interactive_mode():
             method = method_map.get(method_choice, 'hybrid')
             
             try:
-                summary = summarizer.summarize(text, num_sentences=num_sentences, method=method)
-                stats = summarizer.get_summary_stats(text, summary)
+                if method not in summaries:
+                    summaries[method] = summarizer.summarize(prepared, num_sentences=num_sentences, method=method)
+                summary = summaries[method]
+                stats = summarizer.compute_delta_stats(original_stats, summary)
                 
                 print(f"\n✨ SUMMARY ({method.upper()} method):")
-                print("-"*80)
+                print(DASH80)
                 print(summary)
-                print("-"*80)
+                print(DASH80)
                 
-                print(f"\n📊 STATISTICS:")
-                print(f"   • Original: {stats['original_words']} words, {stats['original_sentences']} sentences")
-                print(f"   • Summary: {stats['summary_words']} words, {stats['summary_sentences']} sentences")
-                print(f"   • Compression Ratio: {stats['compression_ratio']}")
+                print(
+                    f"\n📊 STATISTICS:\n{original_line}\n"
+                    f"   • Summary: {stats['summary_words']} words, {stats['summary_sentences']} sentences\n"
+                    f"   • Compression Ratio: {stats['compression_ratio']}"
+                )
                 
             except Exception as e:
                 print(f"\n❌ Error: {e}")
@@ -4,19 +4,100 @@ A comprehensive NLP-based tool for summarizing lengthy articles using multiple t
 """
 
 import re
+import sys
 import heapq
-from collections import defaultdict
+import functools
+from itertools import chain, repeat
+from collections import Counter, defaultdict
 import math
 
 
+DASH80 = "-" * 80
+
+# Patterns are compiled once here rather than looked up by string on every call
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s.!?]')
+# ASCII characters that _SPECIAL_CHARS_RE removes, as a str.translate deletion table.
+# Deleting them with translate is a flat table lookup, faster than the regex engine.
+_SPECIAL_CHARS_TABLE = str.maketrans({c: None for c in map(chr, range(128)) if _SPECIAL_CHARS_RE.match(c)})
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7f]')
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Sentence boundary: whitespace that follows terminal punctuation
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+def count_words(text):
+    """Count whitespace-separated words."""
+    # str.split builds a throwaway list, but it is several times faster than counting regex matches
+    return len(text.split())
+
+
+@functools.lru_cache(maxsize=32)
+def _split_sentences(text):
+    """Split text into sentences, caching the result for repeated calls on the same text."""
+    # Simple sentence tokenization
+    sentences = _SENTENCE_SPLIT_RE.split(text)
+    # Strip each piece once and drop the ones left empty
+    return tuple(filter(None, map(str.strip, sentences)))
+
+
+@functools.lru_cache(maxsize=8192)
+def _tokenize_words_cached(text, stop_words):
+    """Split text into words and remove stop words, caching the result per (text, stop words)."""
+    words = _WORD_RE.findall(text.lower())
+    # Interning makes repeated words share one object, which speeds up later dict lookups.
+    # The cheap length test runs first so short words skip the set lookup.
+    return tuple(sys.intern(word) for word in words if len(word) > 2 and word not in stop_words)
+
+
+@functools.lru_cache(maxsize=64)
+def _position_scores(total):
+    """Position scores for a document of `total` sentences; a tuple so cached results stay immutable."""
+    if total == 0:
+        return ()
+    
+    # Middle sentences get decreasing scores
+    scores = [0.5] * total
+    scores[-1] = 0.8  # Last sentence is important
+    scores[0] = 1.0  # First sentence is very important
+    
+    return tuple(scores)
+
+
+class PreparedDoc:
+    """
+    Per-article artifacts shared by all summarization methods.
+    Created by TextSummarizer.prepare() and accepted by summarize() in place of raw text.
+    """
+    
+    def __init__(self, text, sentences, word_tokens, freq_dict, tfidf_matrix, position_scores):
+        self.text = text
+        self.sentences = sentences
+        self.word_tokens = word_tokens
+        self.freq_dict = freq_dict
+        self.tfidf_matrix = tfidf_matrix
+        self.position_scores = position_scores
+
+
 class TextSummarizer:
     """
     A text summarization tool using extractive summarization techniques.
     Implements TF-IDF and frequency-based approaches.
+    
+    summarize() goes through preprocess_text(), tokenize_sentences() and tokenize_words(),
+    so overriding those in a subclass changes every method. The calculate_*, score_sentences_*
+    and combine_scores() methods are standalone helpers that summarize() does not call;
+    overriding them does not change its output.
     """
     
+    # Number of prepared documents kept for repeated summarize() calls on the same text
+    PREPARED_CACHE_SIZE = 8
+    
     def __init__(self):
-        self.stop_words = set([
+        self._prepared_cache = {}
+        
+        self.stop_words = [
             'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves', 'you', 
             'your', 'yours', 'yourself', 'yourselves', 'he', 'him', 'his', 'himself',
             'she', 'her', 'hers', 'herself', 'it', 'its', 'itself', 'they', 'them',
@@ -31,35 +112,62 @@ class TextSummarizer:
             'all', 'both', 'each', 'few', 'more', 'most', 'other', 'some', 'such',
             'no', 'nor', 'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very',
             's', 't', 'can', 'will', 'just', 'don', 'should', 'now'
-        ])
+        ]
+    
+    @property
+    def stop_words(self):
+        """Words ignored when scoring, as a frozenset so they can key the tokenization caches."""
+        return self._stop_words
+    
+    @stop_words.setter
+    def stop_words(self, words):
+        # Any iterable is accepted, e.g. a set built from the defaults.
+        # Interned so membership tests can match on identity before comparing strings.
+        self._stop_words = frozenset(sys.intern(word) for word in words)
     
     def preprocess_text(self, text):
         """Clean and preprocess the input text."""
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         # Remove special characters but keep sentence structure
-        text = re.sub(r'[^\w\s.!?]', '', text)
+        text = text.translate(_SPECIAL_CHARS_TABLE)
+        # The table only covers ASCII; let the regex handle anything else
+        if _NON_ASCII_RE.search(text):
+            text = _SPECIAL_CHARS_RE.sub('', text)
         return text.strip()
     
     def tokenize_sentences(self, text):
         """Split text into sentences."""
-        # Simple sentence tokenization
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        return list(_split_sentences(text))
     
     def tokenize_words(self, text):
         """Split text into words and remove stop words."""
-        words = re.findall(r'\b\w+\b', text.lower())
-        return [word for word in words if word not in self.stop_words and len(word) > 2]
+        return list(_tokenize_words_cached(text, self.stop_words))
+    
+    @classmethod
+    def clear_cache(cls):
+        """Drop all cached tokenizations and position scores, e.g. before a large unrelated corpus."""
+        _split_sentences.cache_clear()
+        _tokenize_words_cached.cache_clear()
+        _position_scores.cache_clear()
+    
+    def reset_cache(self):
+        """Forget the documents this summarizer has prepared and clear the shared module-level caches."""
+        self._prepared_cache.clear()
+        self.clear_cache()
     
     def calculate_word_frequencies(self, sentences):
         """Calculate word frequencies across all sentences."""
-        word_freq = defaultdict(int)
-        
-        for sentence in sentences:
-            words = self.tokenize_words(sentence)
-            for word in words:
-                word_freq[word] += 1
+        return self._word_freq_from_tokens([self.tokenize_words(sentence) for sentence in sentences])
+    
+    def calculate_tfidf(self, sentences):
+        """Calculate TF-IDF scores for words."""
+        return self._tfidf_from_tokens([self.tokenize_words(sentence) for sentence in sentences])
+    
+    def _word_freq_from_tokens(self, word_tokens):
+        """Calculate word frequencies from sentences that are already tokenized."""
+        # Counter consumes the whole token stream in C, which beats summing the per-sentence rows
+        word_freq = Counter(chain.from_iterable(word_tokens))
         
         # Normalize frequencies
         if word_freq:
@@ -69,84 +177,60 @@ class TextSummarizer:
         
         return word_freq
     
-    def calculate_tfidf(self, sentences):
-        """Calculate TF-IDF scores for words."""
-        # Calculate term frequency for each sentence
-        tf_matrix = []
-        for sentence in sentences:
-            words = self.tokenize_words(sentence)
-            word_count = defaultdict(int)
-            for word in words:
-                word_count[word] += 1
-            
-            # Normalize by sentence length
-            total_words = len(words)
-            if total_words > 0:
-                for word in word_count:
-                    word_count[word] = word_count[word] / total_words
-            
-            tf_matrix.append(word_count)
-        
-        # Calculate inverse document frequency
-        idf = defaultdict(float)
-        total_sentences = len(sentences)
-        
-        for word in set(word for sentence in tf_matrix for word in sentence):
-            doc_count = sum(1 for sentence in tf_matrix if word in sentence)
-            idf[word] = math.log(total_sentences / (doc_count + 1))
+    def _tfidf_from_tokens(self, word_tokens):
+        """Calculate TF-IDF scores from sentences that are already tokenized."""
+        # Count terms in each sentence; rows are sparse, holding only the words present
+        count_matrix = [Counter(words) for words in word_tokens]
+        
+        # Calculate inverse document frequency, counting each word once per sentence
+        doc_counts = Counter(chain.from_iterable(count_matrix))
+        
+        total_sentences = len(word_tokens)
+        # Most words share a handful of document counts, so take each distinct log only once
+        idf_by_count = {
+            doc_count: math.log(total_sentences / (doc_count + 1)) for doc_count in set(doc_counts.values())
+        }
+        idf = {word: idf_by_count[doc_count] for word, doc_count in doc_counts.items()}
         
-        # Calculate TF-IDF
+        # Calculate TF-IDF, normalizing term counts by sentence length as each row is built
         tfidf_matrix = []
-        for tf in tf_matrix:
-            tfidf = {word: tf[word] * idf[word] for word in tf}
-            tfidf_matrix.append(tfidf)
+        for words, word_count in zip(word_tokens, count_matrix):
+            total_words = len(words)
+            tfidf_matrix.append({word: count / total_words * idf[word] for word, count in word_count.items()})
         
         return tfidf_matrix
     
+    def _score_frequency_vec(self, word_tokens, word_freq):
+        """Score every sentence by word frequency, returning a list indexed by sentence."""
+        lookup = word_freq.get
+        
+        # map() sums each sentence's word weights without a Python-level loop per word.
+        # Normalize by sentence length to avoid bias towards longer sentences.
+        return [
+            sum(map(lookup, words, repeat(0))) / len(words) if words else 0
+            for words in word_tokens
+        ]
+    
+    def _score_tfidf_vec(self, tfidf_matrix):
+        """Score every sentence by TF-IDF, returning a list indexed by sentence."""
+        return [sum(tfidf.values()) for tfidf in tfidf_matrix]
+    
+    def _score_position_vec(self, total):
+        """Score every sentence by position, returning a tuple indexed by sentence."""
+        return _position_scores(total)
+    
     def score_sentences_frequency(self, sentences, word_freq):
         """Score sentences based on word frequency."""
-        sentence_scores = {}
-        
-        for i, sentence in enumerate(sentences):
-            words = self.tokenize_words(sentence)
-            score = 0
-            
-            for word in words:
-                score += word_freq.get(word, 0)
-            
-            # Normalize by sentence length to avoid bias towards longer sentences
-            if len(words) > 0:
-                sentence_scores[i] = score / len(words)
-            else:
-                sentence_scores[i] = 0
-        
-        return sentence_scores
+        word_tokens = [self.tokenize_words(sentence) for sentence in sentences]
+        return dict(enumerate(self._score_frequency_vec(word_tokens, word_freq)))
     
     def score_sentences_tfidf(self, sentences, tfidf_matrix):
         """Score sentences based on TF-IDF."""
-        sentence_scores = {}
-        
-        for i, tfidf in enumerate(tfidf_matrix):
-            score = sum(tfidf.values())
-            sentence_scores[i] = score
-        
-        return sentence_scores
+        return dict(enumerate(self._score_tfidf_vec(tfidf_matrix)))
     
     def score_sentences_position(self, sentences):
         """Score sentences based on their position (first and last sentences are important)."""
-        sentence_scores = {}
-        total = len(sentences)
-        
-        for i in range(total):
-            if i == 0:
-                sentence_scores[i] = 1.0  # First sentence is very important
-            elif i == total - 1:
-                sentence_scores[i] = 0.8  # Last sentence is important
-            else:
-                # Middle sentences get decreasing scores
-                sentence_scores[i] = 0.5
-        
-        return sentence_scores
+        return dict(enumerate(self._score_position_vec(len(sentences))))
     
     def combine_scores(self, *score_dicts, weights=None):
         """Combine multiple scoring methods with optional weights."""
@@ -161,73 +245,157 @@ class TextSummarizer:
         
         return combined
     
-    def summarize(self, text, num_sentences=3, method='hybrid'):
+    def prepare(self, text):
         """
-        Summarize the input text.
+        Preprocess the text and compute the artifacts used by every scoring method.
         
         Args:
             text (str): The input text to summarize
-            num_sentences (int): Number of sentences in the summary
-            method (str): Summarization method - 'frequency', 'tfidf', 'position', or 'hybrid'
         
         Returns:
-            str: The summarized text
+            PreparedDoc: Reusable input for summarize()
         """
-        # Preprocess
         text = self.preprocess_text(text)
-        sentences = self.tokenize_sentences(text)
+        # Always a fresh document: the cached ones are shared, so they never leave this class
+        return self._prepare_sentences(text, self.tokenize_sentences(text))
+    
+    def _prepare_cached(self, text, sentences):
+        """Return the prepared document for preprocessed text, reusing one built by an earlier summarize()."""
+        key = (text, self.stop_words)
+        doc = self._prepared_cache.get(key)
+        
+        if doc is None:
+            doc = self._prepare_sentences(text, sentences)
+            # Evict the oldest entry first; dicts keep insertion order
+            if len(self._prepared_cache) >= self.PREPARED_CACHE_SIZE:
+                del self._prepared_cache[next(iter(self._prepared_cache))]
+            self._prepared_cache[key] = doc
+        
+        return doc
+    
+    def _prepare_sentences(self, text, sentences):
+        """Compute the scoring artifacts for already preprocessed and split text."""
+        # Tokenize each sentence once and share the tokens with every calculation
+        word_tokens = [self.tokenize_words(sentence) for sentence in sentences]
+        
+        return PreparedDoc(
+            text=text,
+            sentences=sentences,
+            word_tokens=word_tokens,
+            freq_dict=self._word_freq_from_tokens(word_tokens),
+            tfidf_matrix=self._tfidf_from_tokens(word_tokens),
+            position_scores=self._score_position_vec(len(sentences))
+        )
+    
+    def _score_methods(self, doc, methods):
+        """Score every sentence for each method, computing the scores hybrid reuses only once."""
+        for method in methods:
+            if method not in ('frequency', 'tfidf', 'position', 'hybrid'):
+                raise ValueError(f"Unknown method: {method}")
         
-        if len(sentences) <= num_sentences:
-            return text
-        
-        # Calculate scores based on method
-        if method == 'frequency':
-            word_freq = self.calculate_word_frequencies(sentences)
-            scores = self.score_sentences_frequency(sentences, word_freq)
-        
-        elif method == 'tfidf':
-            tfidf_matrix = self.calculate_tfidf(sentences)
-            scores = self.score_sentences_tfidf(sentences, tfidf_matrix)
-        
-        elif method == 'position':
-            scores = self.score_sentences_position(sentences)
-        
-        elif method == 'hybrid':
-            # Combine all methods
-            word_freq = self.calculate_word_frequencies(sentences)
-            tfidf_matrix = self.calculate_tfidf(sentences)
-            
-            freq_scores = self.score_sentences_frequency(sentences, word_freq)
-            tfidf_scores = self.score_sentences_tfidf(sentences, tfidf_matrix)
-            position_scores = self.score_sentences_position(sentences)
-            
-            # Combine with weights: TF-IDF (0.5), Frequency (0.3), Position (0.2)
-            scores = self.combine_scores(
-                tfidf_scores, freq_scores, position_scores,
-                weights=[0.5, 0.3, 0.2]
-            )
+        needed = set(methods)
+        if 'hybrid' in needed:
+            needed.update(('frequency', 'tfidf', 'position'))
         
-        else:
-            raise ValueError(f"Unknown method: {method}")
+        scores = {}
+        
+        if 'frequency' in needed:
+            scores['frequency'] = self._score_frequency_vec(doc.word_tokens, doc.freq_dict)
+        
+        if 'tfidf' in needed:
+            scores['tfidf'] = self._score_tfidf_vec(doc.tfidf_matrix)
         
+        if 'position' in needed:
+            scores['position'] = doc.position_scores
+        
+        if 'hybrid' in needed:
+            # Combine with weights: TF-IDF (0.5), Frequency (0.3), Position (0.2)
+            scores['hybrid'] = [
+                tfidf * 0.5 + freq * 0.3 + position * 0.2
+                for tfidf, freq, position in zip(scores['tfidf'], scores['frequency'], scores['position'])
+            ]
+        
+        return scores
+    
+    def _build_summary(self, sentences, scores, num_sentences):
+        """Join the top-scoring sentences in their original order."""
         # Get top sentences
         top_sentence_indices = heapq.nlargest(
-            num_sentences, scores.keys(), key=lambda k: scores[k]
+            num_sentences, range(len(scores)), key=scores.__getitem__
         )
         
         # Sort by original order to maintain coherence
         top_sentence_indices.sort()
         
         # Build summary
-        summary = ' '.join([sentences[i] for i in top_sentence_indices])
+        return ' '.join([sentences[i] for i in top_sentence_indices])
+    
+    def summarize(self, text, num_sentences=3, method='hybrid'):
+        """
+        Summarize the input text.
+        
+        Args:
+            text (str or PreparedDoc): The input text to summarize, or the result of prepare()
+            num_sentences (int): Number of sentences in the summary
+            method (str): Summarization method - 'frequency', 'tfidf', 'position', or 'hybrid'
         
-        return summary
+        Returns:
+            str: The summarized text
+        """
+        return self.summarize_multi(text, num_sentences, methods=(method,))[method]
+    
+    def summarize_multi(self, text, num_sentences=3, methods=('frequency', 'tfidf', 'position', 'hybrid')):
+        """
+        Summarize the input text with several methods, sharing tokenization and scoring.
+        
+        Args:
+            text (str or PreparedDoc): The input text to summarize, or the result of prepare()
+            num_sentences (int): Number of sentences in each summary
+            methods (list or tuple): Summarization methods to run
+        
+        Returns:
+            dict: The summarized text for each method, in the order given
+        """
+        if isinstance(text, PreparedDoc):
+            doc = text
+            text, sentences = doc.text, doc.sentences
+        else:
+            # Preprocess, but leave the scoring artifacts until we know they are needed
+            doc = None
+            text = self.preprocess_text(text)
+            # Each split needs a terminator, so this text cannot have more than num_sentences sentences
+            if text.count('.') + text.count('!') + text.count('?') < num_sentences:
+                return {method: text for method in methods}
+            sentences = self.tokenize_sentences(text)
+        
+        if len(sentences) <= num_sentences:
+            return {method: text for method in methods}
+        
+        if doc is None:
+            doc = self._prepare_cached(text, sentences)
+        
+        scores = self._score_methods(doc, methods)
+        
+        return {
+            method: self._build_summary(sentences, scores[method], num_sentences)
+            for method in methods
+        }
     
     def get_summary_stats(self, original_text, summary):
         """Get statistics about the summarization."""
-        original_words = len(original_text.split())
-        summary_words = len(summary.split())
-        original_sentences = len(self.tokenize_sentences(original_text))
+        return self.compute_delta_stats(self.compute_original_stats(original_text), summary)
+    
+    def compute_original_stats(self, text):
+        """Get the statistics of the original text, for reuse across many summaries of it."""
+        return {
+            'original_words': count_words(text),
+            'original_sentences': len(self.tokenize_sentences(text))
+        }
+    
+    def compute_delta_stats(self, original_stats, summary):
+        """Get statistics about a summary, given the result of compute_original_stats()."""
+        original_words = original_stats['original_words']
+        summary_words = count_words(summary)
         summary_sentences = len(self.tokenize_sentences(summary))
         
         compression_ratio = (1 - summary_words / original_words) * 100 if original_words > 0 else 0
@@ -235,7 +403,7 @@ class TextSummarizer:
         return {
             'original_words': original_words,
             'summary_words': summary_words,
-            'original_sentences': original_sentences,
+            'original_sentences': original_stats['original_sentences'],
             'summary_sentences': summary_sentences,
             'compression_ratio': f"{compression_ratio:.1f}%"
         }
@@ -318,13 +486,14 @@ def main():
     print(f"\n{sample_article.strip()}\n")
     
     methods = ['frequency', 'tfidf', 'position', 'hybrid']
+    original_stats = summarizer.compute_original_stats(sample_article)
     
     for method in methods:
         print(f"\n🔍 METHOD: {method.upper()}")
-        print("-" * 80)
+        print(DASH80)
         
         summary = summarizer.summarize(sample_article, num_sentences=3, method=method)
-        stats = summarizer.get_summary_stats(sample_article, summary)
+        stats = summarizer.compute_delta_stats(original_stats, summary)
         
         print(f"\n✨ SUMMARY:\n{summary}\n")
         print(f"📊 STATISTICS:")
@@ -340,7 +509,7 @@ def main():
     print(f"\n{climate_article.strip()}\n")
     
     print(f"\n🔍 METHOD: HYBRID (Best Results)")
-    print("-" * 80)
+    print(DASH80)
     
     summary = summarizer.summarize(climate_article, num_sentences=4, method='hybrid')
     stats = summarizer.get_summary_stats(climate_article, summary)